@@ -1,7 +1,11 @@
 from asyncio import as_completed
 from dotenv import load_dotenv
 import os
-import re
+try:
+    # google-re2 is optional: linear-time matching for large directory rescans
+    import re2 as re
+except ImportError:
+    import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from PyPDF2 import PdfReader
 from langchain.embeddings.openai import OpenAIEmbeddings
@@ -27,6 +31,9 @@ faiss_store = FAISS(
 
 splitter = CharacterTextSplitter(chunk_size=10000)
 
+# Compile the filename pattern once instead of on every extract_metadata call
+metadata_pattern = re.compile(r'(\d{4}-\d{2}-\d{2}) (.*?) - (.*?)-(\d+)\.pdf')
+
 def process_pdf(file_path):
     try:
         with open(file_path, 'rb') as f:
@@ -42,8 +49,7 @@ def process_pdf(file_path):
 
 def extract_metadata(file_path):
     filename = os.path.basename(file_path)
-    pattern = r'(\d{4}-\d{2}-\d{2}) (.*?) - (.*?)-(\d+)\.pdf'
-    match = re.match(pattern, filename)
+    match = metadata_pattern.match(filename)
     if match:
         return {
             'meeting_date': match.group(1),